@@ -1,4 +1,4 @@
-from typing import Union
+from typing import Optional, Union
 
 from decouple import config
 from fastapi import Depends, Body, BackgroundTasks, HTTPException
@@ -996,9 +996,13 @@ def errors_get_details(projectId: int, errorId: str, background_tasks: Backgroun
 
 
 @app.get('/{projectId}/errors/{errorId}/stats', tags=['errors'])
-def errors_get_details_right_column(projectId: int, errorId: str, startDate: int = TimeUTC.now(-7),
-                                    endDate: int = TimeUTC.now(), density: int = 7,
+def errors_get_details_right_column(projectId: int, errorId: str, startDate: Optional[int] = None,
+                                    endDate: Optional[int] = None, density: int = 7,
                                     context: schemas.CurrentContext = Depends(OR_context)):
+    if startDate is None:
+        startDate = TimeUTC.now(-7)
+    if endDate is None:
+        endDate = TimeUTC.now()
     data = errors.get_details_chart(project_id=projectId, user_id=context.user_id, error_id=errorId,
                                     **{"startDate": startDate, "endDate": endDate, "density": density})
     return data
@@ -1016,8 +1020,12 @@ def errors_get_details_sourcemaps(projectId: int, errorId: str,
 
 
 @app.get('/{projectId}/errors/{errorId}/{action}', tags=["errors"])
-def add_remove_favorite_error(projectId: int, errorId: str, action: str, startDate: int = TimeUTC.now(-7),
-                              endDate: int = TimeUTC.now(), context: schemas.CurrentContext = Depends(OR_context)):
+def add_remove_favorite_error(projectId: int, errorId: str, action: str, startDate: Optional[int] = None,
+                              endDate: Optional[int] = None, context: schemas.CurrentContext = Depends(OR_context)):
+    if startDate is None:
+        startDate = TimeUTC.now(-7)
+    if endDate is None:
+        endDate = TimeUTC.now()
     if action == "favorite":
         return errors_favorite.favorite_error(project_id=projectId, user_id=context.user_id, error_id=errorId)
     elif action == "sessions":
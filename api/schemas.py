@@ -179,8 +179,8 @@ class WeeklyReportConfigSchema(BaseModel):
 
 
 class GetHeatmapPayloadSchema(BaseModel):
-    startDate: int = Field(TimeUTC.now(delta_days=-30))
-    endDate: int = Field(TimeUTC.now())
+    startDate: int = Field(default_factory=lambda: TimeUTC.now(delta_days=-30))
+    endDate: int = Field(default_factory=lambda: TimeUTC.now())
     url: str = Field(...)
 
 
@@ -741,8 +741,8 @@ class SearchErrorsSchema(FlatSessionsSearchPayloadSchema):
 
 
 class MetricPayloadSchema(BaseModel):
-    startTimestamp: int = Field(TimeUTC.now(delta_days=-1))
-    endTimestamp: int = Field(TimeUTC.now())
+    startTimestamp: int = Field(default_factory=lambda: TimeUTC.now(delta_days=-1))
+    endTimestamp: int = Field(default_factory=lambda: TimeUTC.now())
     density: int = Field(7)
     filters: List[dict] = Field([])
     type: Optional[str] = Field(None)
@@ -818,8 +818,8 @@ class TimeseriesMetricOfType(str, Enum):
 
 
 class CustomMetricSessionsPayloadSchema(FlatSessionsSearch, _PaginatedSchema):
-    startTimestamp: int = Field(TimeUTC.now(-7))
-    endTimestamp: int = Field(TimeUTC.now())
+    startTimestamp: int = Field(default_factory=lambda: TimeUTC.now(-7))
+    endTimestamp: int = Field(default_factory=lambda: TimeUTC.now())
     series: Optional[List[CustomMetricCreateSeriesSchema]] = Field(default=None)
 
     class Config:
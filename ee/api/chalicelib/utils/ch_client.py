@@ -1,4 +1,5 @@
 import logging
+import queue
 
 import clickhouse_driver
 from decouple import config
@@ -15,23 +16,50 @@ if config('ch_receive_timeout', cast=int, default=-1) > 0:
     settings = {**settings, "receive_timeout": config('ch_receive_timeout', cast=int)}
 
 
-class ClickHouseClient:
-    __client = None
+def _make_client():
+    return clickhouse_driver.Client(host=config("ch_host"),
+                                    database="default",
+                                    port=config("ch_port", cast=int),
+                                    settings=settings)
+
+
+# clickhouse_driver.Client is not thread-safe and connects lazily, so the pool is a queue of clients that
+# keep their connection open between borrows; the default size matches the 40 threads FastAPI (anyio) uses
+# to run sync endpoints, so a worker is never throttled below its own concurrency by the pool
+CH_POOL = config('CH_POOL', cast=bool, default=True)
+CH_POOL_TIMEOUT = config("ch_pool_timeout", cast=int, default=10)
+clickHouse_pool: queue.Queue = None
+if CH_POOL:
+    clickHouse_pool = queue.Queue(maxsize=config("ch_maxconn", cast=int, default=40))
+    for _ in range(clickHouse_pool.maxsize):
+        clickHouse_pool.put(_make_client())
+    logging.info(f">CH_POOL:{clickHouse_pool.maxsize}")
 
-    def __init__(self):
-        self.__client = clickhouse_driver.Client(host=config("ch_host"),
-                                                 database="default",
-                                                 port=config("ch_port", cast=int),
-                                                 settings=settings) \
-            if self.__client is None else self.__client
 
+def _borrow_client():
+    try:
+        return clickHouse_pool.get(timeout=CH_POOL_TIMEOUT)
+    except queue.Empty:
+        logging.error(f"CH-pool exhausted: no client returned within {CH_POOL_TIMEOUT}s "
+                      f"(ch_maxconn={clickHouse_pool.maxsize})")
+        raise TimeoutError("no ClickHouse client available in the pool")
+
+
+class ClickHouseClient:
     def __enter__(self):
+        self.__client = _borrow_client() if CH_POOL else _make_client()
         return self
 
     def execute(self, query, params=None, **args):
         try:
             results = self.__client.execute(query=query, params=params, with_column_types=True, **args)
             keys = tuple(x for x, y in results[1])
+            if args.get("columnar"):
+                # columnar blocks: one list per column, keyed by column name;
+                # an empty result still carries the column names, so keep them as empty columns
+                if len(results[0]) == 0:
+                    return {k: [] for k in keys}
+                return {k: list(c) for k, c in zip(keys, results[0])}
             return [dict(zip(keys, i)) for i in results[0]]
         except Exception as err:
             logging.error("--------- CH QUERY EXCEPTION -----------")
@@ -51,4 +79,7 @@ class ClickHouseClient:
         return self.__client.substitute_params(query, params, self.__client.connection.context)
 
     def __exit__(self, *args):
-        pass
+        if CH_POOL:
+            clickHouse_pool.put(self.__client)
+        else:
+            self.__client.disconnect()
@@ -34,8 +34,8 @@ class EditMemberSchema(EditUserSchema):
 
 class TrailSearchPayloadSchema(schemas._PaginatedSchema):
     limit: int = Field(default=200, gt=0)
-    startDate: int = Field(default=TimeUTC.now(-7))
-    endDate: int = Field(default=TimeUTC.now(1))
+    startDate: int = Field(default_factory=lambda: TimeUTC.now(-7))
+    endDate: int = Field(default_factory=lambda: TimeUTC.now(1))
     user_id: Optional[int] = Field(default=None)
     query: Optional[str] = Field(default=None)
     action: Optional[str] = Field(default=None)
@@ -0,0 +1,49 @@
+import os
+import unittest
+from unittest import mock
+
+os.environ.setdefault("ch_host", "localhost")
+os.environ.setdefault("ch_port", "9000")
+
+from chalicelib.utils import ch_client
+
+COLUMNS = [("url", "String"), ("avg", "Float64")]
+
+
+class TestExecuteColumnar(unittest.TestCase):
+    def execute(self, data, **args):
+        with ch_client.ClickHouseClient() as ch, \
+                mock.patch.object(ch.client(), "execute", return_value=(data, COLUMNS)):
+            return ch.execute(query="SELECT url, avg FROM t", **args)
+
+    def test_rows(self):
+        self.assertEqual(self.execute([("/a", 1.0), ("/b", 2.0)]),
+                         [{"url": "/a", "avg": 1.0}, {"url": "/b", "avg": 2.0}])
+
+    def test_columnar(self):
+        self.assertEqual(self.execute([("/a", "/b"), (1.0, 2.0)], columnar=True),
+                         {"url": ["/a", "/b"], "avg": [1.0, 2.0]})
+
+    def test_columnar_empty_keeps_columns(self):
+        self.assertEqual(self.execute([], columnar=True), {"url": [], "avg": []})
+
+
+class TestPool(unittest.TestCase):
+    def test_borrowed_on_enter_returned_on_exit(self):
+        size = ch_client.clickHouse_pool.qsize()
+        ch = ch_client.ClickHouseClient()
+        self.assertEqual(ch_client.clickHouse_pool.qsize(), size)
+        with ch:
+            self.assertEqual(ch_client.clickHouse_pool.qsize(), size - 1)
+        self.assertEqual(ch_client.clickHouse_pool.qsize(), size)
+
+    def test_exhausted_pool_times_out(self):
+        with mock.patch.object(ch_client, "clickHouse_pool", ch_client.queue.Queue(maxsize=1)), \
+                mock.patch.object(ch_client, "CH_POOL_TIMEOUT", 0.01):
+            with self.assertRaises(TimeoutError), self.assertLogs(level="ERROR"):
+                with ch_client.ClickHouseClient():
+                    pass
+
+
+if __name__ == "__main__":
+    unittest.main()